@@ -93,6 +93,25 @@ def harvest_namespace(args):
         setattr(config, f, v)
 
 
+def make_parser():
+    """
+    Return the main parser with all options added
+    """
+    parser = new_parser()
+    for opt in sorted(all_options):
+        var = opt2var(opt)
+        names = [opt] + OptionAliases.__dict__.get(var, [])
+        parser.add_argument(*names, **OptionKwargs[var])
+    return parser
+
+
+def get_help_text():
+    """
+    Return the help text that -h/--help prints, without printing it or exiting
+    """
+    return make_parser().format_help()
+
+
 def parse_log_options(arglist):
     """
     Parse the commands and options that need to be handled first.
@@ -124,14 +143,8 @@ def parse_cmdline_options(arglist):
     # interpret logging/version options early
     args, remainder = parse_log_options(arglist)
 
-    # set up parser
-    parser = new_parser()
-
-    # add all options to the parser
-    for opt in sorted(all_options):
-        var = opt2var(opt)
-        names = [opt] + OptionAliases.__dict__.get(var, [])
-        parser.add_argument(*names, **OptionKwargs[var])
+    # set up parser with all options
+    parser = make_parser()
 
     # parse the options
     try:
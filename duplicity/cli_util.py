@@ -22,6 +22,7 @@
 Utils for parse command line, check for consistency, and set config
 """
 
+import functools
 import io
 import os
 import re
@@ -352,6 +353,7 @@ def make_bytes(value):
         return bytes(value, "utf-8")
 
 
+@functools.lru_cache(maxsize=None)
 def var2cmd(s):
     """
     Convert var name to command string
@@ -359,6 +361,7 @@ def var2cmd(s):
     return s.replace("_", "-")
 
 
+@functools.lru_cache(maxsize=None)
 def var2opt(s):
     """
     Convert var name to option string
@@ -369,6 +372,7 @@ def var2opt(s):
         return f"-{s}"
 
 
+@functools.lru_cache(maxsize=None)
 def cmd2var(s):
     """
     Convert command string to var name
@@ -376,6 +380,7 @@ def cmd2var(s):
     return s.replace("-", "_")
 
 
+@functools.lru_cache(maxsize=None)
 def opt2var(s):
     """
     Convert option string to var name
@@ -21,10 +21,12 @@
 
 """Store global configuration information"""
 
+import copy
 import os
 import pickle
 import socket
 import sys
+import types
 
 from duplicity import __version__, log
 from duplicity import gpg
@@ -433,3 +435,26 @@ def load_dict(config_dict, config):
     """
     for k, v in config_dict.items():
         setattr(config, k, v)
+
+
+def snapshot(config):
+    """
+    returns a deep copy of the config settings to be used with restore().
+
+    skips all internal attributes (__var__), modules and functions.
+    """
+    return copy.deepcopy(
+        {
+            k: v
+            for k, v in config.__dict__.items()
+            if not (k.startswith("__") and k.endswith("__"))
+            and not isinstance(v, (types.ModuleType, types.FunctionType))
+        }
+    )
+
+
+def restore(snap, config):
+    """
+    reset config to a snapshot() with a single dict update.
+    """
+    config.__dict__.update(copy.deepcopy(snap))
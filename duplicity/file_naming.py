@@ -20,6 +20,7 @@
 
 """Produce and parse the names of duplicity's backup files"""
 
+import functools
 import re
 
 from duplicity import config
@@ -38,30 +39,20 @@ full_sig_re = None
 full_sig_re_short = None
 new_sig_re = None
 new_sig_re_short = None
+stat_re = None
+stat_re_short = None
 
+# the file prefixes the regexes above were compiled for
+regex_prefixes = None
 
-def prepare_regex(force=False):
-    global full_vol_re
-    global full_vol_re_short
-    global full_manifest_re
-    global full_manifest_re_short
-    global inc_vol_re
-    global inc_vol_re_short
-    global inc_manifest_re
-    global inc_manifest_re_short
-    global full_sig_re
-    global full_sig_re_short
-    global new_sig_re
-    global new_sig_re_short
-    global stat_re
-    global stat_re_short
-
-    # we force regex re-generation in unit tests because file prefixes might have changed
-    if full_vol_re and not force:
-        return
 
+@functools.lru_cache(maxsize=None)
+def _build_regex(file_prefix, file_prefix_manifest, file_prefix_archive, file_prefix_signature, file_prefix_jsonstat):
+    """
+    Return the compiled filename regexes for the given set of file prefixes
+    """
     full_vol_re = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_archive + b"duplicity-full"
+        b"^" + file_prefix + file_prefix_archive + b"duplicity-full"
         b"\\.(?P<time>.*?)"
         b"\\.vol(?P<num>[0-9]+)"
         b"\\.difftar"
@@ -70,7 +61,7 @@ def prepare_regex(force=False):
     )
 
     full_vol_re_short = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_archive + b"df"
+        b"^" + file_prefix + file_prefix_archive + b"df"
         b"\\.(?P<time>[0-9a-z]+?)"
         b"\\.(?P<num>[0-9a-z]+)"
         b"\\.dt"
@@ -79,7 +70,7 @@ def prepare_regex(force=False):
     )
 
     full_manifest_re = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_manifest + b"duplicity-full"
+        b"^" + file_prefix + file_prefix_manifest + b"duplicity-full"
         b"\\.(?P<time>.*?)"
         b"\\.manifest"
         b"(?P<partial>(\\.part))?"
@@ -87,7 +78,7 @@ def prepare_regex(force=False):
     )
 
     full_manifest_re_short = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_manifest + b"df"
+        b"^" + file_prefix + file_prefix_manifest + b"df"
         b"\\.(?P<time>[0-9a-z]+?)"
         b"\\.m"
         b"(?P<partial>(\\.p))?"
@@ -95,7 +86,7 @@ def prepare_regex(force=False):
     )
 
     inc_vol_re = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_archive + b"duplicity-inc"
+        b"^" + file_prefix + file_prefix_archive + b"duplicity-inc"
         b"\\.(?P<start_time>.*?)"
         b"\\.to\\.(?P<end_time>.*?)"
         b"\\.vol(?P<num>[0-9]+)"
@@ -104,7 +95,7 @@ def prepare_regex(force=False):
     )
 
     inc_vol_re_short = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_archive + b"di"
+        b"^" + file_prefix + file_prefix_archive + b"di"
         b"\\.(?P<start_time>[0-9a-z]+?)"
         b"\\.(?P<end_time>[0-9a-z]+?)"
         b"\\.(?P<num>[0-9a-z]+)"
@@ -113,7 +104,7 @@ def prepare_regex(force=False):
     )
 
     inc_manifest_re = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_manifest + b"duplicity-inc"
+        b"^" + file_prefix + file_prefix_manifest + b"duplicity-inc"
         b"\\.(?P<start_time>.*?)"
         b"\\.to"
         b"\\.(?P<end_time>.*?)"
@@ -123,7 +114,7 @@ def prepare_regex(force=False):
     )
 
     inc_manifest_re_short = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_manifest + b"di"
+        b"^" + file_prefix + file_prefix_manifest + b"di"
         b"\\.(?P<start_time>[0-9a-z]+?)"
         b"\\.(?P<end_time>[0-9a-z]+?)"
         b"\\.m"
@@ -132,7 +123,7 @@ def prepare_regex(force=False):
     )
 
     full_sig_re = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_signature + b"duplicity-full-signatures"
+        b"^" + file_prefix + file_prefix_signature + b"duplicity-full-signatures"
         b"\\.(?P<time>.*?)"
         b"\\.sigtar"
         b"(?P<partial>(\\.part))?"
@@ -140,7 +131,7 @@ def prepare_regex(force=False):
     )
 
     full_sig_re_short = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_signature + b"dfs"
+        b"^" + file_prefix + file_prefix_signature + b"dfs"
         b"\\.(?P<time>[0-9a-z]+?)"
         b"\\.st"
         b"(?P<partial>(\\.p))?"
@@ -148,7 +139,7 @@ def prepare_regex(force=False):
     )
 
     new_sig_re = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_signature + b"duplicity-new-signatures"
+        b"^" + file_prefix + file_prefix_signature + b"duplicity-new-signatures"
         b"\\.(?P<start_time>.*?)"
         b"\\.to"
         b"\\.(?P<end_time>.*?)"
@@ -158,7 +149,7 @@ def prepare_regex(force=False):
     )
 
     new_sig_re_short = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_signature + b"dns"
+        b"^" + file_prefix + file_prefix_signature + b"dns"
         b"\\.(?P<start_time>[0-9a-z]+?)"
         b"\\.(?P<end_time>[0-9a-z]+?)"
         b"\\.st"
@@ -166,7 +157,7 @@ def prepare_regex(force=False):
         b"(\\.|$)"
     )
     stat_re = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_jsonstat + b"duplicity-(?P<type>full|inc)"
+        b"^" + file_prefix + file_prefix_jsonstat + b"duplicity-(?P<type>full|inc)"
         b"\\.(?P<time>.*?)"
         b"(?:\\.to\\.(?P<end_time>.+?))?"
         b"\\.jsonstat"
@@ -175,7 +166,7 @@ def prepare_regex(force=False):
     )
 
     stat_re_short = re.compile(
-        b"^" + config.file_prefix + config.file_prefix_jsonstat + b"(?P<type>dfst|dist)"
+        b"^" + file_prefix + file_prefix_jsonstat + b"(?P<type>dfst|dist)"
         b"\\.(?P<time>.*?)"
         b"(?:\\.to\\.(?P<end_time>.+?))?"
         b"\\.jst"
@@ -183,6 +174,70 @@ def prepare_regex(force=False):
         b"(\\.|$)"
     )
 
+    return (
+        full_vol_re,
+        full_vol_re_short,
+        full_manifest_re,
+        full_manifest_re_short,
+        inc_vol_re,
+        inc_vol_re_short,
+        inc_manifest_re,
+        inc_manifest_re_short,
+        full_sig_re,
+        full_sig_re_short,
+        new_sig_re,
+        new_sig_re_short,
+        stat_re,
+        stat_re_short,
+    )
+
+
+def prepare_regex(force=False):
+    global full_vol_re
+    global full_vol_re_short
+    global full_manifest_re
+    global full_manifest_re_short
+    global inc_vol_re
+    global inc_vol_re_short
+    global inc_manifest_re
+    global inc_manifest_re_short
+    global full_sig_re
+    global full_sig_re_short
+    global new_sig_re
+    global new_sig_re_short
+    global stat_re
+    global stat_re_short
+    global regex_prefixes
+
+    # we force regex re-generation in unit tests because file prefixes might have changed,
+    # compiled regexes are cached per set of prefixes so this is cheap when they have not
+    if full_vol_re and not force:
+        return
+
+    regex_prefixes = (
+        config.file_prefix,
+        config.file_prefix_manifest,
+        config.file_prefix_archive,
+        config.file_prefix_signature,
+        config.file_prefix_jsonstat,
+    )
+    (
+        full_vol_re,
+        full_vol_re_short,
+        full_manifest_re,
+        full_manifest_re_short,
+        inc_vol_re,
+        inc_vol_re_short,
+        inc_manifest_re,
+        inc_manifest_re_short,
+        full_sig_re,
+        full_sig_re_short,
+        new_sig_re,
+        new_sig_re_short,
+        stat_re,
+        stat_re_short,
+    ) = _build_regex(*regex_prefixes)
+
 
 def to_base36(n):
     """
@@ -332,6 +387,19 @@ def get(
 def parse(filename):
     """
     Parse duplicity filename, return None or ParseResults object
+
+    Results are cached and shared between callers, which is safe
+    because ParseResults objects are read-only.
+    """
+    prepare_regex()
+    return _parse(filename, regex_prefixes)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse(filename, _prefixes):
+    """
+    Parse filename with the current regexes, _prefixes ties the cache
+    entry to the full set of file prefixes they were compiled for
     """
 
     def str2time(timestr, short):
@@ -359,6 +427,13 @@ def parse(filename):
         else:
             return int(s)
 
+    # encryption and compression only depend on the suffix, so every
+    # result can be built complete
+    suffix_flags = {
+        "compressed": filename.endswith(b".z") or filename.endswith(b".gz"),
+        "encrypted": filename.endswith(b".g") or filename.endswith(b".gpg"),
+    }
+
     def check_full():
         """
         Return ParseResults if file is from full backup, None otherwise
@@ -379,6 +454,7 @@ def parse(filename):
                         "full",
                         time=t,
                         volume_number=get_vol_num(m1.group("num"), short),
+                        **suffix_flags,
                     )
                 else:
                     return ParseResults(
@@ -386,6 +462,7 @@ def parse(filename):
                         time=t,
                         manifest=True,
                         partial=(m2.group("partial") is not None),
+                        **suffix_flags,
                     )
         return None
 
@@ -411,6 +488,7 @@ def parse(filename):
                         start_time=t1,
                         end_time=t2,
                         volume_number=get_vol_num(m1.group("num"), short),
+                        **suffix_flags,
                     )
                 else:
                     return ParseResults(
@@ -419,6 +497,7 @@ def parse(filename):
                         end_time=t2,
                         manifest=1,
                         partial=(m2.group("partial") is not None),
+                        **suffix_flags,
                     )
         return None
 
@@ -435,7 +514,7 @@ def parse(filename):
         if m:
             t = str2time(m.group("time"), short)
             if t:
-                return ParseResults("full-sig", time=t, partial=(m.group("partial") is not None))
+                return ParseResults("full-sig", time=t, partial=(m.group("partial") is not None), **suffix_flags)
             else:
                 return None
 
@@ -453,6 +532,7 @@ def parse(filename):
                     start_time=t1,
                     end_time=t2,
                     partial=(m.group("partial") is not None),
+                    **suffix_flags,
                 )
         return None
 
@@ -486,19 +566,12 @@ def parse(filename):
                 start_time=start_time,
                 end_time=end_time,
                 partial=(m.group("partial") is not None),
+                **suffix_flags,
             )
 
-    def set_encryption_or_compression(pr):
-        """
-        Set encryption and compression flags in ParseResults pr
-        """
-        pr.compressed = filename.endswith(b".z") or filename.endswith(b".gz")
-        pr.encrypted = filename.endswith(b".g") or filename.endswith(b".gpg")
-
     for check in (check_full, check_inc, check_sig, check_stat):
         pr = check()
         if pr:
-            set_encryption_or_compression(pr)
             return pr
     return None
 
@@ -506,8 +579,23 @@ def parse(filename):
 class ParseResults:
     """
     Hold information taken from a duplicity filename
+
+    Instances are read-only once built, parse() hands the same object to
+    every caller asking about the same filename.
     """
 
+    __slots__ = (
+        "type",
+        "manifest",
+        "volume_number",
+        "time",
+        "start_time",
+        "end_time",
+        "compressed",
+        "encrypted",
+        "partial",
+    )
+
     def __init__(
         self,
         type,
@@ -540,6 +628,11 @@ class ParseResults:
 
         self.partial = partial
 
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f"ParseResults is read-only, cannot set {name!r}")
+        super().__setattr__(name, value)
+
     def __eq__(self, other):
         return (
             self.type == other.type
@@ -21,6 +21,9 @@
 
 """Define some lazy data structures and functions acting on them"""
 
+import builtins
+import functools
+import itertools
 import os
 import sys
 
@@ -35,15 +38,12 @@ class Iter(object):
     @staticmethod
     def filter(predicate, iterator):
         """Like filter in a lazy functional programming language"""
-        for i in iterator:
-            if predicate(i):
-                yield i
+        return builtins.filter(predicate, iterator)
 
     @staticmethod
     def map(function, iterator):
         """Like map in a lazy functional programming language"""
-        for i in iterator:
-            yield function(i)
+        return builtins.map(function, iterator)
 
     @staticmethod
     def foreach(function, iterator):
@@ -139,12 +139,7 @@ class Iter(object):
     @staticmethod
     def foldl(f, default, iter):  # pylint: disable=redefined-builtin
         """the fundamental list iteration operator.."""
-        while True:
-            try:
-                next_item = next(iter)
-            except StopIteration:
-                return default
-            default = f(default, next_item)
+        return functools.reduce(f, iter, default)
 
     @staticmethod
     def multiplex(iter, num_of_forks, final_func=None, closing_func=None):  # pylint: disable=redefined-builtin
@@ -157,9 +152,9 @@ class Iter(object):
         when all the streams are finished.
 
         """
-        if num_of_forks == 2 and not final_func and not closing_func:
-            im2 = IterMultiplex2(iter)
-            return im2.yielda(), im2.yieldb()
+        if not final_func and not closing_func:
+            # nothing to hook into the buffer, so let tee do the work in C
+            return itertools.tee(iter, num_of_forks)
         if not final_func:
             final_func = lambda i: None
         if not closing_func:
@@ -211,55 +206,6 @@ class Iter(object):
         return tuple(map(make_iterator, range(num_of_forks)))
 
 
-class IterMultiplex2(object):
-    """Multiplex an iterator into 2 parts
-
-    This is a special optimized case of the Iter.multiplex function,
-    used when there is no closing_func or final_func, and we only want
-    to split it into 2.  By profiling, this is a time sensitive class.
-
-    """
-
-    def __init__(self, iter):  # pylint: disable=redefined-builtin
-        self.a_leading_by = 0  # How many places a is ahead of b
-        self.buffer = []
-        self.iter = iter
-
-    def yielda(self):
-        """Return first iterator"""
-        buf, iter = self.buffer, self.iter  # pylint: disable=redefined-builtin
-        while True:
-            if self.a_leading_by >= 0:
-                # a is in front, add new element
-                try:
-                    elem = next(iter)
-                except StopIteration:
-                    return
-                buf.append(elem)
-            else:
-                # b is in front, subtract an element
-                elem = buf.pop(0)
-            self.a_leading_by += 1
-            yield elem
-
-    def yieldb(self):
-        """Return second iterator"""
-        buf, iter = self.buffer, self.iter  # pylint: disable=redefined-builtin
-        while True:
-            if self.a_leading_by <= 0:
-                # b is in front, add new element
-                try:
-                    elem = next(iter)
-                except StopIteration:
-                    return
-                buf.append(elem)
-            else:
-                # a is in front, subtract an element
-                elem = buf.pop(0)
-            self.a_leading_by -= 1
-            yield elem
-
-
 class IterTreeReducer(object):
     """Tree style reducer object for iterator - stolen from rdiff-backup
 
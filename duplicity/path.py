@@ -496,7 +496,8 @@ class Path(ROPath):
     code.
     """
 
-    regex_chars_to_quote = re.compile('[\\\\\\"\\$`]')
+    quote_table = str.maketrans({c: f"\\{c}" for c in '\\"$`'})
+    regex_quoted_char = re.compile(r"\\(.)", re.S)
 
     def rename_index(self, index):
         if not config.rename or not index:
@@ -720,21 +721,12 @@ class Path(ROPath):
         """
         if not s:
             s = self.uc_name
-        return '"%s"' % self.regex_chars_to_quote.sub(lambda m: f"\\{m.group(0)}", s)
+        return '"%s"' % s.translate(self.quote_table)
 
     def unquote(self, s):
         """Return unquoted version of string s, as quoted by above quote()"""
         assert s[0] == s[-1] == '"'  # string must be quoted by above
-        result = ""
-        i = 1
-        while i < len(s) - 1:
-            if s[i] == "\\":
-                result += s[i + 1]
-                i += 2
-            else:
-                result += s[i]
-                i += 1
-        return result
+        return self.regex_quoted_char.sub(r"\1", s[1:-1])
 
     def get_filename(self):
         """Return filename of last component"""
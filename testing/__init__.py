@@ -26,7 +26,6 @@ import subprocess
 import sys
 import time
 import unittest
-from importlib import reload
 
 from duplicity import backend
 from duplicity import config
@@ -53,6 +52,10 @@ else:
     # be a little more flexible
     _runtest_dir = os.getenv("TMPDIR", False) or os.getenv("TEMP", False) or "/tmp"
 
+# give each pytest-xdist worker its own runtest dir, testfiles are recreated per test
+if os.getenv("PYTEST_XDIST_WORKER"):
+    _runtest_dir = os.path.join(_runtest_dir, f"duplicity-{os.getenv('PYTEST_XDIST_WORKER')}")
+
 if not os.path.exists(_runtest_dir):
     os.makedirs(_runtest_dir)
 
@@ -76,6 +79,9 @@ os.system(f"chmod 700 {os.path.join(_testing_dir, 'gnupg')}")
 os.environ["TZ"] = "US/Central"
 time.tzset()
 
+# Pristine config, restored before each test
+_config_defaults = config.snapshot(config)
+
 
 class DuplicityTestCase(unittest.TestCase):
     sign_key = "839E6A2856538CCF"
@@ -103,8 +109,8 @@ class DuplicityTestCase(unittest.TestCase):
         # Have all file references in tests relative to our runtest dir
         os.chdir(_runtest_dir)
 
-        # reimport duplicity.config in case it changed
-        reload(config)
+        # reset duplicity.config in case it changed
+        config.restore(_config_defaults, config)
 
     def tearDown(self):
         for key in self.savedEnviron:
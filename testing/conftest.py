@@ -6,6 +6,8 @@ import sys
 
 import pytest
 
+from testing import _runtest_dir
+
 
 @pytest.fixture(scope="function")
 def redirect_stdin():
@@ -27,3 +29,25 @@ def redirect_stdin():
         sys.stdin = stdin_save  # pylint: disable=used-before-assignment
         os.close(targetfd_save)
         nullfile.close()  # pylint: disable=used-before-assignment
+
+
+@pytest.fixture(scope="session")
+def commandline_dirs():
+    """Create the local paths used as command line arguments once per session.
+    Tests run with the runtest dir as cwd, so relative 'foo/bar' etc. resolve there.
+
+    Activate this fixture on unittest test classes by means of:
+    @pytest.mark.usefixtures("commandline_dirs")."""
+    created = []
+    for d in ("foo", "foo/bar", "inc", "full"):
+        path = os.path.join(_runtest_dir, d)
+        if not os.path.isdir(path):
+            os.mkdir(path)
+            created.append(path)
+    yield
+    # only remove what we made, and only while it is still empty
+    for path in reversed(created):
+        try:
+            os.rmdir(path)
+        except OSError:
+            pass
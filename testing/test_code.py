@@ -19,7 +19,7 @@
 # Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
 
 
-import glob
+import io
 import os
 import pycodestyle
 import sys
@@ -34,11 +34,35 @@ import pytest
 
 from . import _top_dir, DuplicityTestCase
 
+try:
+    from pylint import lint
+    from pylint.reporters.text import TextReporter
+except ImportError:
+    lint = None
+
+
+def find_py_files(dirpath, recursive=False):
+    """
+    Return the .py files in dirpath, optionally descending into subdirs.
+    Like glob, hidden files and directories are skipped.
+    """
+    found = []
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            if entry.name.startswith("."):
+                continue
+            if recursive and entry.is_dir():
+                found.extend(find_py_files(entry.path, recursive))
+            elif entry.name.endswith(".py") and entry.is_file():
+                found.append(entry.path)
+    return found
+
+
 files_to_test = []
-files_to_test.extend(glob.glob(os.path.join(_top_dir, "duplicity/**/*.py"), recursive=True))
-files_to_test.extend(glob.glob(os.path.join(_top_dir, "testing/functional/*.py")))
-files_to_test.extend(glob.glob(os.path.join(_top_dir, "testing/unit/*.py")))
-files_to_test.extend(glob.glob(os.path.join(_top_dir, "testing/*.py")))
+files_to_test.extend(find_py_files(os.path.join(_top_dir, "duplicity"), recursive=True))
+files_to_test.extend(find_py_files(os.path.join(_top_dir, "testing/functional")))
+files_to_test.extend(find_py_files(os.path.join(_top_dir, "testing/unit")))
+files_to_test.extend(find_py_files(os.path.join(_top_dir, "testing")))
 
 # don't test argparse311.py.  not really ours.
 files_to_test.remove(os.path.join(_top_dir, "duplicity/argparse311.py"))
@@ -84,15 +108,29 @@ class CodeTest(DuplicityTestCase):
             f"Found {result.total_errors} code style errors (and warnings).",
         )
 
+    @unittest.skipIf(lint is None, "pylint not installed")
     def test_pylint(self):
         """Pylint test (requires pylint to be installed to pass)"""
+        # run in-process so astroid's import and module cache are not
+        # paid for again in a fresh interpreter.  The reporter must not
+        # hold sys.stdout: with jobs > 1 pylint pickles the linter, and
+        # pytest's captured stdout cannot be pickled.
         print()
-        self.run_checker(
+        output = io.StringIO()
+        result = lint.Run(
             [
-                "pylint",
                 f"--rcfile={os.path.join(_top_dir, 'setup.cfg')}",
             ]
-            + files_to_test
+            + files_to_test,
+            reporter=TextReporter(output),
+            exit=False,
+        )
+        for line in output.getvalue().split("\n"):
+            print(line, file=sys.stderr)
+        self.assertEqual(
+            result.linter.msg_status,
+            0,
+            f"Test failed: msg_status = {result.linter.msg_status}",
         )
 
 
@@ -23,6 +23,8 @@
 import os
 import unittest
 
+import pytest
+
 from duplicity import config
 from duplicity import dup_time
 from duplicity import file_naming
@@ -53,52 +55,32 @@ class Test36(UnitTestCase):
 class FileNamingBase(object):
     """Holds file naming test functions, for use in subclasses"""
 
+    # (type, get() kwargs, expected attributes of the parse result)
+    basic_cases = (
+        ("inc", {"volume_number": 23}, {"start_time": 10, "end_time": 20, "volume_number": 23}),
+        ("full-sig", {}, {"time": 20}),
+        ("new-sig", {}, {"start_time": 10, "end_time": 20}),
+        ("full-stat", {}, {"time": 20}),
+        ("inc-stat", {}, {"start_time": 10, "end_time": 20}),
+    )
+
     def test_basic(self):
         """Check get/parse cycle"""
         dup_time.setprevtime(10)
         dup_time.setcurtime(20)
 
-        file_naming.prepare_regex(force=True)
-        filename = file_naming.get("inc", volume_number=23)
-        log.Info(f"Inc filename: {os.fsdecode(filename)}")
-        pr = file_naming.parse(filename)
-        assert pr and pr.type == "inc", pr
-        assert pr.start_time == 10
-        assert pr.end_time == 20
-        assert pr.volume_number == 23
-        assert not pr.partial
-
-        filename = file_naming.get("full-sig")
-        log.Info(f"Full sig filename: {os.fsdecode(filename)}")
-        pr = file_naming.parse(filename)
-        assert pr.type == "full-sig"
-        assert pr.time == 20
-        assert not pr.partial
-
-        filename = file_naming.get("new-sig")
-        pr = file_naming.parse(filename)
-        assert pr.type == "new-sig"
-        assert pr.start_time == 10
-        assert pr.end_time == 20
-        assert not pr.partial
-
-        filename = file_naming.get("full-stat")
-        log.Info(f"Full sig filename: {os.fsdecode(filename)}")
-        pr = file_naming.parse(filename)
-        assert pr.type == "full-stat"
-        assert pr.time == 20
-        assert not pr.partial
-
-        filename = file_naming.get("inc-stat")
-        pr = file_naming.parse(filename)
-        assert pr.type == "inc-stat"
-        assert pr.start_time == 10
-        assert pr.end_time == 20
-        assert not pr.partial
+        for ftype, kwargs, expected in self.basic_cases:
+            with self.subTest(type=ftype):
+                filename = file_naming.get(ftype, **kwargs)
+                log.Info(f"{ftype} filename: {os.fsdecode(filename)}")
+                pr = file_naming.parse(filename)
+                assert pr and pr.type == ftype, pr
+                for attr, value in expected.items():
+                    assert getattr(pr, attr) == value, (attr, getattr(pr, attr))
+                assert not pr.partial
 
     def test_suffix(self):
         """Test suffix (encrypt/compressed) encoding and generation"""
-        file_naming.prepare_regex(force=True)
         filename = file_naming.get("inc", manifest=1, gzipped=1)
         pr = file_naming.parse(filename)
         assert pr and pr.compressed == 1
@@ -111,38 +93,34 @@ class FileNamingBase(object):
 
     def test_more(self):
         """More file_parsing tests"""
-        file_naming.prepare_regex(force=True)
-        pr = file_naming.parse(config.file_prefix + config.file_prefix_signature + b"dns.h112bi.h14rg0.st.g")
+        pr = file_naming.parse(self.sig_prefix + b"dns.h112bi.h14rg0.st.g")
         assert pr, pr
         assert pr.type == "new-sig"
         assert pr.end_time == 1029826800
 
         pr = file_naming.parse(
-            config.file_prefix
-            + config.file_prefix_signature
+            self.sig_prefix
             + b"duplicity-new-signatures.2002-08-18T00:04:30-07:00.to.2002-08-20T00:00:00-07:00.sigtar.gpg"
         )  # noqa
         assert pr, pr
         assert pr.type == "new-sig"
         assert pr.end_time == 1029826800
 
-        pr = file_naming.parse(config.file_prefix + config.file_prefix_signature + b"dfs.h5dixs.st.g")
+        pr = file_naming.parse(self.sig_prefix + b"dfs.h5dixs.st.g")
         assert pr, pr
         assert pr.type == "full-sig"
         assert pr.time == 1036954144, repr(pr.time)
 
     def test_partial(self):
         """Test addition of partial flag"""
-        file_naming.prepare_regex(force=True)
-        pr = file_naming.parse(config.file_prefix + config.file_prefix_signature + b"dns.h112bi.h14rg0.st.p.g")
+        pr = file_naming.parse(self.sig_prefix + b"dns.h112bi.h14rg0.st.p.g")
         assert pr, pr
         assert pr.partial
         assert pr.type == "new-sig"
         assert pr.end_time == 1029826800
 
         pr = file_naming.parse(
-            config.file_prefix
-            + config.file_prefix_signature
+            self.sig_prefix
             + b"duplicity-new-signatures.2002-08-18T00:04:30-07:00.to.2002-08-20T00:00:00-07:00.sigtar.part.gpg"
         )  # noqa
         assert pr, pr
@@ -150,20 +128,52 @@ class FileNamingBase(object):
         assert pr.type == "new-sig"
         assert pr.end_time == 1029826800
 
-        pr = file_naming.parse(config.file_prefix + config.file_prefix_signature + b"dfs.h5dixs.st.p.g")
+        pr = file_naming.parse(self.sig_prefix + b"dfs.h5dixs.st.p.g")
         assert pr, pr
         assert pr.partial
         assert pr.type == "full-sig"
         assert pr.time == 1036954144, repr(pr.time)
 
 
+@pytest.mark.xdist_group("file_naming")
 class FileNaming(UnitTestCase, FileNamingBase):
     """Test long filename parsing and generation"""
 
     def setUp(self):
         super().setUp()
+        file_naming.prepare_regex(force=True)
+        self.sig_prefix = config.file_prefix + config.file_prefix_signature
+
+    def tearDown(self):
+        super().tearDown()
+        # test_signature_prefix_change leaves regexes for its prefix behind
+        file_naming.prepare_regex(force=True)
+
+    def test_signature_prefix_change(self):
+        """Changing only the signature prefix must not hit cached parses"""
+        filename = b"dns.h112bi.h14rg0.st.g"
+        pr = file_naming.parse(filename)
+        assert pr and pr.type == "new-sig", pr
 
+        self.set_config("file_prefix_signature", b"sign-")
+        file_naming.prepare_regex(force=True)
+        assert file_naming.parse(filename) is None
+        pr = file_naming.parse(b"sign-" + filename)
+        assert pr and pr.type == "new-sig", pr
+
+    def test_results_read_only(self):
+        """Cached parse results cannot be changed by a caller"""
+        filename = self.sig_prefix + b"dfs.h5dixs.st.g"
+        pr = file_naming.parse(filename)
+        with self.assertRaises(AttributeError):
+            pr.partial = True
+        with self.assertRaises(AttributeError):
+            pr.extra = 1
+        assert file_naming.parse(filename) is pr
+        assert not pr.partial
 
+
+@pytest.mark.xdist_group("file_naming")
 class FileNamingPrefixes(UnitTestCase, FileNamingBase):
     """Test filename parsing and generation with prefixes"""
 
@@ -174,6 +184,13 @@ class FileNamingPrefixes(UnitTestCase, FileNamingBase):
         self.set_config("file_prefix_signature", b"sign-")
         self.set_config("file_prefix_archive", b"arch-")
         self.set_config("file_prefix_jsonstat", b"jsonstat-")
+        file_naming.prepare_regex(force=True)
+        self.sig_prefix = config.file_prefix + config.file_prefix_signature
+
+    def tearDown(self):
+        super().tearDown()
+        # don't leave regexes for our prefixes behind for later tests
+        file_naming.prepare_regex(force=True)
 
 
 if __name__ == "__main__":
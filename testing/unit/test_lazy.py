@@ -24,16 +24,15 @@
 
 import pickle
 import unittest
-from functools import reduce
 
 from duplicity.lazy import *  # pylint: disable=unused-wildcard-import,redefined-builtin
 from . import UnitTestCase
 
 
 class Iterators(UnitTestCase):
-    one_to_100 = lambda s: iter(list(range(1, 101)))
-    evens = lambda s: iter(list(range(2, 101, 2)))
-    odds = lambda s: iter(list(range(1, 100, 2)))
+    one_to_100 = lambda s: iter(range(1, 101))
+    evens = lambda s: iter(range(2, 101, 2))
+    odds = lambda s: iter(range(1, 100, 2))
     empty = lambda s: iter([])
 
     def __init__(self, *args):
@@ -84,8 +83,8 @@ class IterEqualTestCase(Iterators):
     def testNormal(self):
         """See if normal iterators are equal"""
         assert Iter.equal(iter((1, 2, 3)), iter((1, 2, 3)))
-        assert Iter.equal(self.odds(), iter(list(range(1, 100, 2))))
-        assert Iter.equal(iter((1, 2, 3)), iter(list(range(1, 4))))
+        assert Iter.equal(self.odds(), iter(range(1, 100, 2)))
+        assert Iter.equal(iter((1, 2, 3)), iter(range(1, 4)))
 
     def testNormalInequality(self):
         """See if normal unequals work"""
@@ -136,7 +135,7 @@ class MapTestCase(Iterators):
 
     def testNumbers(self):
         """1 to 100 * 2 = 2 to 200"""
-        assert Iter.equal(Iter.map(lambda x: 2 * x, self.one_to_100()), iter(list(range(2, 201, 2))))
+        assert Iter.equal(Iter.map(lambda x: 2 * x, self.one_to_100()), iter(range(2, 201, 2)))
 
     def testShortcut(self):
         """Map should go in order"""
@@ -164,7 +163,7 @@ class CatTestCase(Iterators):
     def testNumbers(self):
         """1 to 50 + 51 to 100 = 1 to 100"""
         assert Iter.equal(
-            Iter.cat(iter(list(range(1, 51))), iter(list(range(51, 101)))),
+            Iter.cat(iter(range(1, 51)), iter(range(51, 101))),
             self.one_to_100(),
         )
 
@@ -221,8 +220,8 @@ class FoldingTest(Iterators):
 
     def testLargeAddition(self):
         """Folds on 10000 element iterators"""
-        assert Iter.foldl(self.f, 0, iter(list(range(1, 10001)))) == 50005000
-        self.assertRaises(RuntimeError, Iter.foldr, self.f, 0, iter(list(range(1, 10001))))
+        assert Iter.foldl(self.f, 0, iter(range(1, 10001))) == 50005000
+        self.assertRaises(RuntimeError, Iter.foldr, self.f, 0, iter(range(1, 10001)))
 
     def testLen(self):
         """Use folds to calculate length of lists"""
@@ -258,6 +257,14 @@ class MultiplexTest(Iterators):
         assert Iter.equal(i1, self.one_to_100())
         assert Iter.equal(i2, self.one_to_100())
 
+    def testTripleNoFuncs(self):
+        """Test splitting into three with interleaved reads"""
+        i1, i2, i3 = Iter.multiplex(self.one_to_100(), 3)
+        assert next(i3) == 1 and next(i3) == 2
+        assert Iter.equal(i1, self.one_to_100())
+        assert next(i2) == 1
+        assert Iter.equal(i3, iter(range(3, 101)))
+
 
 class ITRBadder(ITRBranch):
     def start_process(self, index):  # pylint: disable=unused-argument
@@ -280,7 +287,7 @@ class ITRBadder2(ITRBranch):
 
     def end_process(self):
         # print "Adding ", self.base_index
-        self.total += reduce(lambda x, y: x + y, self.base_index, 0)
+        self.total += sum(self.base_index)
 
     def can_fast_process(self, index):
         if len(index) == 3:
@@ -48,6 +48,7 @@ class PathTest(UnitTestCase):
         assert p.quote() == '"hello"'
         assert p.quote("\\") == '"\\\\"', p.quote("\\")
         assert p.quote("$HELLO") == '"\\$HELLO"'
+        assert p.quote('say "`hi`"') == '"say \\"\\`hi\\`\\""'
 
     def test_unquote(self):
         """Test path unquoting"""